@@ -171,6 +171,47 @@ def test_normalization(pdf_factory):
         assert result_ext == pytest.approx(test_yield, rel=0.05)
 
 
+def test_normalization_cache():
+    mu, sigma = create_mu_sigma_2()
+    gauss = TmpGaussian(mu=mu, sigma=sigma, obs=obs1)
+    limits = Space(obs1, limits=(low, high))
+    mu_initial = mu.value().numpy()
+
+    n_evaluations = []
+    fallback_normalization = gauss._fallback_normalization
+
+    def counting_fallback_normalization(limits):
+        n_evaluations.append(1)
+        return fallback_normalization(limits)
+
+    gauss._fallback_normalization = counting_fallback_normalization
+
+    with zfit.run.set_graph_mode(False):
+        norm = gauss.normalization(limits).numpy()
+        assert gauss.normalization(limits).numpy() == norm
+        assert len(n_evaluations) == 1
+
+        mu.set_value(mu_initial + 0.5)
+        norm_shifted = gauss.normalization(limits).numpy()
+        assert len(n_evaluations) == 2
+        assert norm_shifted != pytest.approx(norm, rel=1e-3)
+
+        mu.set_value(mu_initial)
+        with tf.GradientTape() as tape:
+            norm_cached = gauss.normalization(limits)
+        gradients_cached = tape.gradient(norm_cached, [mu, sigma])
+        assert len(n_evaluations) == 3  # from the gradient
+
+        gauss._DEFAULTS_normalization_cache_size = 0
+        with tf.GradientTape() as tape:
+            norm_uncached = gauss.normalization(limits)
+        gradients_uncached = tape.gradient(norm_uncached, [mu, sigma])
+
+    assert norm_cached.numpy() == norm
+    assert norm_uncached.numpy() == pytest.approx(norm)
+    np.testing.assert_allclose(gradients_cached, gradients_uncached)
+
+
 @pytest.mark.parametrize('gauss_factory', [create_gauss1, create_test_gauss1])
 def test_sampling_simple(gauss_factory):
     gauss = gauss_factory()
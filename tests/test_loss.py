@@ -280,3 +280,94 @@ def test_simple_loss():
     assert true_a == pytest.approx(result.params[a_param]['value'], rel=0.03)
     assert true_b == pytest.approx(result.params[b_param]['value'], rel=0.06)
     assert true_c == pytest.approx(result.params[c_param]['value'], rel=0.5)
+
+
+@pytest.mark.parametrize('graph', [False, True])
+@pytest.mark.parametrize('weighted', [False, True])
+@pytest.mark.parametrize('extended', [False, True])
+def test_chunked_nll(graph, weighted, extended):
+    old_active, old_chunksize = zfit.run.chunking.active, zfit.run.chunking.max_n_points
+    zfit.run.set_graph_mode(graph)
+    obs_wide = zfit.Space('obs1', (-30, 30))
+    fit_range = (-10, 8)  # narrower than the data, cuts data and weights
+
+    n_events = 3005
+    values = np.random.normal(loc=mu_true, scale=sigma_true, size=n_events)
+    values2 = np.random.normal(loc=mu_true2, scale=sigma_true2, size=n_events)
+    weights = np.random.uniform(0.5, 1.5, size=n_events) if weighted else None
+    data = zfit.Data.from_numpy(obs=obs_wide, array=values, weights=weights)
+    data2 = zfit.Data.from_numpy(obs=obs_wide, array=values2, weights=weights)
+
+    mu1, sigma1 = create_params1()
+    mu2, sigma2 = create_params2()
+    gauss1 = Gauss(mu1, sigma1, obs=obs_wide)
+    gauss2 = Gauss(mu2, sigma2, obs=obs_wide)
+    params = [mu1, sigma1, mu2, sigma2]
+    if extended:
+        yield1 = zfit.Parameter('yield1', n_events * 0.9)
+        gauss1.set_yield(yield1)
+        params.append(yield1)
+        nll = zfit.loss.ExtendedUnbinnedNLL(model=gauss1, data=data, fit_range=fit_range)
+        params = [mu1, sigma1, yield1]
+    else:
+        nll = UnbinnedNLL(model=[gauss1, gauss2], data=[data, data2], fit_range=[fit_range, fit_range])
+
+    try:
+        zfit.run.chunking.active = False
+        value_true, gradients_true, hessian_true = nll.value_gradients_hessian(params=params)
+
+        zfit.run.chunking.active = True
+        zfit.run.chunking.max_n_points = 1000  # does not divide the number of events
+        value, gradients = nll.value_gradients(params=params)
+        assert nll.value().numpy() == pytest.approx(value_true.numpy(), rel=1e-10)
+        assert value.numpy() == pytest.approx(value_true.numpy(), rel=1e-10)
+        assert np.array(gradients) == pytest.approx(np.array(gradients_true), rel=1e-8)
+
+        _, _, hessian = nll.value_gradients_hessian(params=params)
+        assert np.array(hessian) == pytest.approx(np.array(hessian_true), rel=1e-8)
+        _, _, hessian_diag = nll.value_gradients_hessian(params=params, hessian='diag')
+        assert np.array(hessian_diag) == pytest.approx(np.diag(hessian_true), rel=1e-8)
+    finally:
+        zfit.run.chunking.active = old_active
+        zfit.run.chunking.max_n_points = old_chunksize
+
+
+def test_chunked_nll_hesse():
+    old_active, old_chunksize = zfit.run.chunking.active, zfit.run.chunking.max_n_points
+    gaussian1, mu1, sigma1 = create_gauss1()
+    data = zfit.Data.from_numpy(obs=obs1, array=test_values_np)
+    nll = UnbinnedNLL(model=gaussian1, data=data)
+    try:
+        zfit.run.chunking.active = True
+        zfit.run.chunking.max_n_points = 700
+        result = Minuit().minimize(nll)
+        errors = result.hesse(method='hesse_np', error_name='chunked')
+
+        zfit.run.chunking.active = False
+        errors_true = result.hesse(method='hesse_np', error_name='unchunked')
+    finally:
+        zfit.run.chunking.active = old_active
+        zfit.run.chunking.max_n_points = old_chunksize
+
+    assert result.converged
+    for param in (mu1, sigma1):
+        assert result.params[param]['value'] == pytest.approx(np.mean(test_values_np) if param is mu1
+                                                              else np.std(test_values_np), rel=0.01)
+        assert errors[param]['error'] == pytest.approx(errors_true[param]['error'], rel=1e-8)
+
+
+def test_chunking_clears_graph_cache(monkeypatch):
+    import zfit.util.cache
+    old_active, old_chunksize = zfit.run.chunking.active, zfit.run.chunking.max_n_points
+    cleared = []
+    monkeypatch.setattr(zfit.util.cache, 'clear_graph_cache', lambda: cleared.append(True))
+    try:
+        zfit.run.chunking.active = old_active
+        assert not cleared
+        zfit.run.chunking.active = not old_active
+        assert len(cleared) == 1
+        zfit.run.chunking.max_n_points = old_chunksize + 1
+        assert len(cleared) == 2
+    finally:
+        zfit.run.chunking.active = old_active
+        zfit.run.chunking.max_n_points = old_chunksize
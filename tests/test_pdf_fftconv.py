@@ -67,6 +67,34 @@ def test_conv_simple(interpolation):
     # plt.show()
 
 
+@pytest.mark.parametrize('n', [51, 300])
+def test_conv_methods(n):
+    n_points = 1000
+    obs = zfit.Space("obs1", limits=(-5, 5))
+    obs_kernel = zfit.Space("obs1", limits=(-2, 2))
+    param2 = zfit.Parameter('param2', 0.3)
+    gauss = zfit.pdf.Gauss(0.1, param2, obs=obs_kernel)
+    func1 = zfit.pdf.Uniform(-3, param2, obs=obs)
+    func2 = zfit.pdf.Uniform(-1.2, -1, obs=obs)
+    func = zfit.pdf.SumPDF([func1, func2], 0.5)
+    conv_auto = zfit.pdf.FFTConvPDFV1(func=func, kernel=gauss, n=n, interpolation='linear')
+    conv_fft = zfit.pdf.FFTConvPDFV1(func=func, kernel=gauss, n=n, interpolation='linear', conv_method='fft')
+    conv_direct = zfit.pdf.FFTConvPDFV1(func=func, kernel=gauss, n=n, interpolation='linear',
+                                        conv_method='direct')
+    assert conv_auto.conv_method == ('fft' if n > zfit.pdf.FFTConvPDFV1.FFT_MIN_N_KERNEL else 'direct')
+    with pytest.raises(ValueError):
+        zfit.pdf.FFTConvPDFV1(func=func, kernel=gauss, n=n, conv_method='not_a_method')
+
+    x = tf.linspace(-5., 5., n_points)
+    probs_fft = conv_fft.pdf(x=x)
+    probs_direct = conv_direct.pdf(x=x)
+    np.testing.assert_allclose(probs_fft, probs_direct, rtol=1e-6, atol=1e-8)
+
+    true_conv = true_conv_np(func, gauss, obs, x, xkernel=tf.linspace(*obs_kernel.limit1d, num=401))
+    np.testing.assert_allclose(probs_fft, true_conv, rtol=0.05, atol=0.02)
+    assert pytest.approx(1, rel=1e-3) == conv_fft.integrate(limits=obs).numpy()
+
+
 def test_conv_1d_shifted():
     obs_kernel = zfit.Space("obs1", limits=(-3, 1.5))
     obs = zfit.Space("obs1", limits=(5, 15))
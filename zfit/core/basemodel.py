@@ -216,6 +216,7 @@ class BaseModel(BaseNumeric, GraphCachable, BaseDimensional, ZfitModel):
             self.integration.draws_per_dim = draws_per_dim
         if mc_sampler is not None:
             self.integration.mc_sampler = mc_sampler
+        self.reset_cache_self()  # cached graphs and integrals used the old options
 
     # TODO: remove below? or add "analytic gradients"?
     def gradients(self, x: ztyping.XType, norm_range: ztyping.LimitsType, params: ztyping.ParamsTypeOpt = None):
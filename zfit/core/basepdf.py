@@ -59,7 +59,7 @@ import tensorflow as tf
 from ..util.deprecation import deprecated
 from zfit import z
 from .sample import extended_sampling
-from ..util.cache import invalidate_graph
+from ..util.cache import invalidate_graph, ParamValueCache
 from .basemodel import BaseModel
 from .baseobject import extract_filter_params
 from .interfaces import ZfitPDF, ZfitParameter
@@ -104,6 +104,7 @@ def _BasePDF_register_check_support(has_support: bool):
 
 
 class BasePDF(ZfitPDF, BaseModel):
+    _DEFAULTS_normalization_cache_size = 16
 
     def __init__(self, obs: ztyping.ObsTypeInput, params: Dict[str, ZfitParameter] = None, dtype: Type = ztypes.float,
                  name: str = "BasePDF",
@@ -210,11 +211,26 @@ class BasePDF(ZfitPDF, BaseModel):
         return self._call_normalization(limits=limits)  # no _norm_* needed
 
     def _call_normalization(self, limits):
-        # TODO: caching? alternative
         with suppress(FunctionNotImplementedError):
             return self._normalization(limits=limits)
+        if self._DEFAULTS_normalization_cache_size and self._normalization_is_numeric(limits):
+            return self._cached_fallback_normalization(limits)
         return self._fallback_normalization(limits)
 
+    def _normalization_is_numeric(self, limits):
+        return len(self._analytic_integral.get_max_axes(limits=limits)) < limits.n_obs
+
+    def _cached_fallback_normalization(self, limits):
+        # the numerical integral is cached on the values of the parameters, so that it is not recalculated if only
+        # parameters that this pdf does not depend on changed (as a yield or the parameters of another pdf in the loss)
+        caches = self._cache.setdefault('normalization', {})
+        cache = caches.get(limits)
+        if cache is None:
+            params = sorted(self.get_params(floating=None, is_yield=False), key=lambda param: param.name)
+            cache = ParamValueCache(params=params, size=self._DEFAULTS_normalization_cache_size, dtype=self.dtype)
+            caches[limits] = cache
+        return cache(lambda: self._fallback_normalization(limits))
+
     def _fallback_normalization(self, limits):
         return self._hook_integrate(limits=limits, norm_range=False)
 
@@ -10,8 +10,9 @@ from ordered_set import OrderedSet
 from .baseobject import BaseNumeric
 from .constraint import BaseConstraint
 from .dependents import _extract_dependencies
-from .interfaces import ZfitLoss, ZfitSpace, ZfitModel, ZfitData
+from .interfaces import ZfitLoss, ZfitSpace, ZfitModel, ZfitData, ZfitPDF
 from .. import z, settings
+from ..settings import ztypes
 from ..util import ztyping
 from ..util.checks import NOT_SPECIFIED
 from ..util.container import convert_to_container, is_container
@@ -43,15 +44,149 @@ def _unbinned_nll_tf(model: ztyping.PDFInputType, data: ztyping.DataInputType, f
                 for p, d, r in zip(model, data, fit_range)]
         nll_finished = tf.reduce_sum(input_tensor=nlls, axis=0)
     else:
-        with data.set_data_range(fit_range):
-            probs = model.pdf(data, norm_range=fit_range)
-        log_probs = tf.math.log(probs)
-        nll = _nll_calc_unbinned_tf(log_probs=log_probs,
-                                    weights=data.weights if data.weights is not None else None)
+        if settings.run.chunking.active:
+            with data.set_data_range(fit_range):
+                nll = _unbinned_nll_chunked_tf(model=model, data=data, fit_range=fit_range)
+        else:
+            with data.set_data_range(fit_range):
+                probs = model.pdf(data, norm_range=fit_range)
+                weights = data.weights  # cut with the same range as the data
+            log_probs = tf.math.log(probs)
+            nll = _nll_calc_unbinned_tf(log_probs=log_probs, weights=weights)
         nll_finished = nll
     return nll_finished
 
 
+def _nll_chunks(model: ZfitPDF, data: ZfitData, fit_range: ZfitSpace):
+    """Split the unbinned nll of a single PDF into chunks of at most `zfit.run.chunking.max_n_points` events.
+
+    Args:
+        model: PDF with a `.pdf` method
+        data: Data to evaluate the `model` on, already cut to the `fit_range`
+        fit_range: Normalization range of the `model`
+
+    Returns:
+        The events (sorted as the obs of the `model`), the weights (or None), a function `chunk_nll(i, x, weights)`
+        returning the nll of the i-th chunk and a function `sum_chunks(func, x, initial)` that sums `func(i)` over
+        all chunks.
+    """
+    chunksize = settings.run.chunksize
+    x = data.value(obs=model.obs)
+    weights = data.weights
+
+    def chunk_nll(i, x, weights):
+        start = i * chunksize
+        weights_chunk = None if weights is None else weights[start:start + chunksize]
+        probs = model.pdf(x[start:start + chunksize], norm_range=fit_range)
+        return _nll_calc_unbinned_tf(log_probs=tf.math.log(probs), weights=weights_chunk)
+
+    def sum_chunks(func, x, initial):
+        n_chunks = (tf.shape(x)[0] + chunksize - 1) // chunksize
+
+        def body(i, total):
+            return i + 1, tf.nest.map_structure(tf.add, total, func(i))
+
+        _, total = tf.while_loop(cond=lambda i, _: i < n_chunks, body=body, loop_vars=(0, initial),
+                                 parallel_iterations=1)
+        return total
+
+    return x, weights, chunk_nll, sum_chunks
+
+
+def _unbinned_nll_chunked_tf(model: ZfitPDF, data: ZfitData, fit_range: ZfitSpace):
+    """Return the unbinned negative log likelihood of a single PDF, evaluated chunk by chunk.
+
+    The events are split into chunks of at most `zfit.run.chunking.max_n_points` events. Only a single chunk is
+    evaluated at a time, for the value as well as for the gradient: the latter is a custom gradient that
+    re-evaluates the chunks one by one and accumulates their gradients. The peak memory is therefore bounded by
+    the chunksize and not by the number of events.
+
+    The custom gradient can not be differentiated again, the hessian is computed chunk by chunk with
+    :py:func:`_unbinned_nll_chunked_value_gradients_hessian`.
+
+    Args:
+        model: PDF with a `.pdf` method
+        data: Data to evaluate the `model` on, already cut to the `fit_range`
+        fit_range: Normalization range of the `model`
+
+    Returns:
+        The unbinned nll
+    """
+    x, weights, chunk_nll, sum_chunks = _nll_chunks(model=model, data=data, fit_range=fit_range)
+    n_events = x.shape[0]
+    if n_events is not None and n_events <= settings.run.chunksize:  # nothing to chunk, avoid the overhead
+        return chunk_nll(0, x, weights)
+
+    # everything that depends on the data is given as an input, otherwise the custom gradient would also
+    # search for variables the data depends on (e.g. the sample holder of a `Sampler`)
+    inputs = [x] if weights is None else [x, weights]
+
+    @tf.custom_gradient
+    def chunked_nll(*inputs):
+        x, weights = inputs[0], inputs[1] if len(inputs) > 1 else None
+        nll = sum_chunks(lambda i: chunk_nll(i, x, weights), x=x, initial=z.constant(0.))
+
+        def grad_fn(dy, variables=None):
+            input_grads = [None] * len(inputs)
+            if variables is None:
+                return input_grads
+
+            def chunk_gradients(i):
+                with tf.GradientTape(watch_accessed_variables=False) as tape:
+                    tape.watch(variables)
+                    nll_chunk = chunk_nll(i, x, weights)
+                return tape.gradient(nll_chunk, sources=variables,
+                                     unconnected_gradients=tf.UnconnectedGradients.ZERO)
+
+            gradients = sum_chunks(chunk_gradients, x=x, initial=[tf.zeros_like(var) for var in variables])
+            return input_grads, [dy * grad for grad in gradients]
+
+        return nll, grad_fn
+
+    return chunked_nll(*inputs)
+
+
+def _value_gradients_hessian_zero_unconnected(func: Callable, params: List["zfit.Parameter"],
+                                              hessian: Optional[str] = None):
+    """Value, gradients and hessian of `func()` wrt `params` using autodiff, unconnected `params` yield zeros."""
+    unconnected = tf.UnconnectedGradients.ZERO
+    with tf.GradientTape(persistent=True, watch_accessed_variables=False) as tape:
+        tape.watch(params)
+        value = func()
+        gradients = tape.gradient(value, sources=params, unconnected_gradients=unconnected)
+    if hessian == 'diag':
+        computed_hessian = tf.stack([tape.gradient(grad, sources=param, unconnected_gradients=unconnected)
+                                     for param, grad in zip(params, gradients)])
+    else:
+        computed_hessian = tf.stack([tf.stack(tape.gradient(grad, sources=params, unconnected_gradients=unconnected))
+                                     for grad in gradients])
+    del tape
+    return value, tf.stack(gradients), computed_hessian
+
+
+def _unbinned_nll_chunked_value_gradients_hessian(model: ZfitPDF, data: ZfitData, fit_range: ZfitSpace,
+                                                  params: List["zfit.Parameter"], hessian: Optional[str] = None):
+    """Return the value, gradients and hessian of the unbinned nll of a single PDF, accumulated chunk by chunk.
+
+    Args:
+        model: PDF with a `.pdf` method
+        data: Data to evaluate the `model` on, already cut to the `fit_range`
+        fit_range: Normalization range of the `model`
+        params: Parameters to take the derivatives with respect to
+        hessian: If 'diag', only the diagonal of the hessian is computed
+
+    Returns:
+        Value, gradients (stacked) and hessian
+    """
+    x, weights, chunk_nll, sum_chunks = _nll_chunks(model=model, data=data, fit_range=fit_range)
+    n_params = len(params)
+    hessian_shape = (n_params,) if hessian == 'diag' else (n_params, n_params)
+    initial = (z.constant(0.), tf.zeros((n_params,), dtype=ztypes.float), tf.zeros(hessian_shape, dtype=ztypes.float))
+    return sum_chunks(lambda i: _value_gradients_hessian_zero_unconnected(lambda: chunk_nll(i, x, weights),
+                                                                           params=params, hessian=hessian),
+                      x=x, initial=initial)
+
+
 @z.function
 def _nll_calc_unbinned_tf(log_probs, weights=None, log_offset=None):
     if weights is not None:
@@ -378,11 +513,36 @@ class UnbinnedNLL(BaseLoss):
     @z.function(wraps='loss')
     def _loss_func_watched(self, constraints, data, fit_range, model):
         nll = _unbinned_nll_tf(model=model, data=data, fit_range=fit_range)
-        if constraints:
-            constraints = z.reduce_sum([c.value() for c in constraints])
-            nll += constraints
+        nll += self._additional_terms(model=model, data=data, constraints=constraints)
         return nll
 
+    def _additional_terms(self, model, data, constraints):
+        """Return the terms of the loss that are not a sum over the events, such as the constraints."""
+        if constraints:
+            return z.reduce_sum([c.value() for c in constraints])
+        return z.constant(0.)
+
+    def _value_gradients_hessian(self, params, hessian, numerical=False):
+        if settings.run.chunking.active and not numerical:
+            return self._chunked_value_gradients_hessian(params=params, hessian=hessian)
+        return super()._value_gradients_hessian(params=params, hessian=hessian, numerical=numerical)
+
+    @z.function(wraps='loss')
+    def _chunked_value_gradients_hessian(self, params, hessian):
+        # the custom gradient of the chunked nll can not be differentiated twice, so the contributions of the
+        # chunks to the hessian are accumulated explicitly
+        value, gradients, computed_hessian = _value_gradients_hessian_zero_unconnected(
+            lambda: self._additional_terms(model=self.model, data=self.data, constraints=self.constraints),
+            params=params, hessian=hessian)
+        for mod, dat, fit_range in zip(self.model, self.data, self.fit_range):
+            with dat.set_data_range(fit_range):
+                nll_value, nll_gradients, nll_hessian = _unbinned_nll_chunked_value_gradients_hessian(
+                    model=mod, data=dat, fit_range=fit_range, params=params, hessian=hessian)
+            value += nll_value
+            gradients += nll_gradients
+            computed_hessian += nll_hessian
+        return value, tf.unstack(gradients), computed_hessian
+
     def _get_params(self, floating: Optional[bool] = True, is_yield: Optional[bool] = None,
                     extract_independent: Optional[bool] = True) -> Set["ZfitParameter"]:
         if not self.is_extended:
@@ -398,9 +558,8 @@ class UnbinnedNLL(BaseLoss):
 class ExtendedUnbinnedNLL(UnbinnedNLL):
     """An Unbinned Negative Log Likelihood with an additional poisson term for the"""
 
-    @z.function(wraps='loss')
-    def _loss_func(self, model, data, fit_range, constraints):
-        nll = super()._loss_func(model=model, data=data, fit_range=fit_range, constraints=constraints)
+    def _additional_terms(self, model, data, constraints):
+        nll = super()._additional_terms(model=model, data=data, constraints=constraints)
         yields = []
         nevents_collected = []
         for mod, dat in zip(model, data):
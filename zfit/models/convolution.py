@@ -16,6 +16,7 @@ from ..util.exception import WorkInProgressError, ShapeIncompatibleError
 
 
 class FFTConvPDFV1(BaseFunctor):
+    FFT_MIN_N_KERNEL = 100
 
     def __init__(self,
                  func: ZfitPDF,
@@ -24,6 +25,7 @@ class FFTConvPDFV1(BaseFunctor):
                  limits_func: Union[ztyping.LimitsType, float] = None,
                  limits_kernel: ztyping.LimitsType = None,
                  interpolation: Optional[str] = None,
+                 conv_method: Optional[str] = None,
                  obs: ztyping.ObsTypeInput = None,
                  name: str = "FFTConvV1"):
         r"""*EXPERIMENTAL* Numerical Convolution pdf of `func` convoluted with `kernel` using FFT
@@ -96,12 +98,21 @@ class FFTConvPDFV1(BaseFunctor):
                   a system of equations. When using 1000+ points this can affect the runtime critical.
                   However, it provides better solutions that are smooth even with less points
                   than for a linear interpolation.
+            conv_method: Method to calculate the discrete convolution of the evaluated points. Available
+                methods are:
+                - 'direct': a direct convolution with `tf.nn.convolution`, scaling as O(n_func * n_kernel).
+                  Fast for small grids.
+                - 'fft': multiplication in the Fourier space using a real FFT of the zero padded grids,
+                  scaling as O(N log N) with N = n_func + n_kernel. Fast for large grids and wide kernels.
+                If `None`, 'fft' is used if the kernel has more than `FFT_MIN_N_KERNEL` points,
+                otherwise 'direct'.
             obs: Observables of the class. If not specified, automatically taken from `func`
             name: Human readable name of the PDF
         """
         from zfit import run
         run.assert_executing_eagerly()
         valid_interpolations = ('spline', 'linear')
+        valid_conv_methods = ('direct', 'fft')
 
         obs = func.space if obs is None else obs
         super().__init__(obs=obs, pdfs=[func, kernel], params={}, name=name)
@@ -161,6 +172,13 @@ class FFTConvPDFV1(BaseFunctor):
         if not n % 2:
             n += 1  # make it odd to have a unique shifting when using "same" in the convolution
 
+        if conv_method is None:
+            conv_method = 'fft' if n > self.FFT_MIN_N_KERNEL else 'direct'
+        if conv_method not in valid_conv_methods:
+            raise ValueError(f"`conv_method` {conv_method} not known. Has to be one "
+                             f"of the following: {valid_conv_methods}")
+        self._conv_method = conv_method
+
         lower_func, upper_func = limits_func.rect_limits
         lower_kernel, upper_kernel = limits_kernel.rect_limits
         lower_sample = lower_func + lower_kernel
@@ -233,28 +251,31 @@ class FFTConvPDFV1(BaseFunctor):
         y_func = tf.reshape(y_func, func_dims)
         y_kernel = tf.reshape(y_kernel, kernel_dims)
 
-        # flip the kernel to use the cross-correlation called `convolution function from TF
-        # convolution = cross-correlation with flipped kernel
-        y_kernel = tf.reverse(y_kernel, axis=range(self.n_obs))
+        if self.conv_method == 'fft':
+            conv = fft_convolve_same(y_func, y_kernel)[None, ..., None]
+        else:
+            # flip the kernel to use the cross-correlation called `convolution function from TF
+            # convolution = cross-correlation with flipped kernel
+            y_kernel = tf.reverse(y_kernel, axis=range(self.n_obs))
 
-        # make rectangular grid
-        y_func_rect = tf.reshape(y_func, func_dims)
-        y_kernel_rect = tf.reshape(y_kernel, kernel_dims)
+            # make rectangular grid
+            y_func_rect = tf.reshape(y_func, func_dims)
+            y_kernel_rect = tf.reshape(y_kernel, kernel_dims)
 
-        # needed for multi dims?
-        # if self.n_obs == 2:
-        #     y_kernel_rect = tf.linalg.adjoint(y_kernel_rect)
+            # needed for multi dims?
+            # if self.n_obs == 2:
+            #     y_kernel_rect = tf.linalg.adjoint(y_kernel_rect)
 
-        # get correct shape for tf.nn.convolution
-        y_func_rect_conv = tf.reshape(y_func_rect, (1, *func_dims, 1))
-        y_kernel_rect_conv = tf.reshape(y_kernel_rect, (*kernel_dims, 1, 1))
+            # get correct shape for tf.nn.convolution
+            y_func_rect_conv = tf.reshape(y_func_rect, (1, *func_dims, 1))
+            y_kernel_rect_conv = tf.reshape(y_kernel_rect, (*kernel_dims, 1, 1))
 
-        conv = tf.nn.convolution(
-            input=y_func_rect_conv,
-            filters=y_kernel_rect_conv,
-            strides=1,
-            padding='SAME',
-        )
+            conv = tf.nn.convolution(
+                input=y_func_rect_conv,
+                filters=y_kernel_rect_conv,
+                strides=1,
+                padding='SAME',
+            )
 
         # needed for multidims?
         # if self.n_obs == 2:
@@ -288,6 +309,10 @@ class FFTConvPDFV1(BaseFunctor):
     def conv_interpolation(self):
         return self._conv_interpolation
 
+    @property
+    def conv_method(self):
+        return self._conv_method
+
     @supports()
     def _sample(self, n, limits):
         # this is a custom implementation of sampling. Since the kernel and func are not correlated,
@@ -320,6 +345,32 @@ class FFTConvPDFV1(BaseFunctor):
         return sample
 
 
+def fft_convolve_same(func_values: tf.Tensor, kernel_values: tf.Tensor) -> tf.Tensor:
+    """Convolve two grids of values using a real FFT, cropped to the (centered) shape of `func_values`.
+
+    Both grids are zero padded to the size of the full convolution, so there is no circular overlap. This
+    is equivalent to `scipy.signal.fftconvolve(func_values, kernel_values, mode='same')` for kernels with an
+    odd number of points in every dimension.
+
+    Args:
+        func_values: Values of the function on a regular grid with 1 to 3 dimensions.
+        kernel_values: Values of the kernel on a regular grid with the same binwidth and number of dimensions.
+
+    Returns:
+        The convolution with the shape of `func_values`.
+    """
+    n_dims = len(func_values.shape)
+    rfft, irfft = {1: (tf.signal.rfft, tf.signal.irfft),
+                   2: (tf.signal.rfft2d, tf.signal.irfft2d),
+                   3: (tf.signal.rfft3d, tf.signal.irfft3d)}[n_dims]
+    func_shape = tf.shape(func_values)
+    kernel_shape = tf.shape(kernel_values)
+    fft_length = func_shape + kernel_shape - 1
+    conv = irfft(rfft(func_values, fft_length=fft_length) * rfft(kernel_values, fft_length=fft_length),
+                 fft_length=fft_length)
+    return tf.slice(conv, begin=(kernel_shape - 1) // 2, size=func_shape)
+
+
 class AddingSampleAndWeights:
 
     def __init__(self, func, kernel) -> None:
@@ -54,10 +54,11 @@ Example with a pdf that caches the normalization:
 import functools
 import weakref
 from abc import abstractmethod
-from typing import Iterable, Union, Mapping
+from typing import Callable, Iterable, Union, Mapping
 
 import numpy as np
 import tensorflow as tf
+from tensorflow.python.ops.resource_variable_ops import ResourceVariable
 
 from . import ztyping
 from .container import convert_to_container
@@ -293,6 +294,86 @@ class FunctionCacheHolder(GraphCachable):
         return f"<FunctionCacheHolder: {self.python_func}, valid={self.is_valid}>"
 
 
+class ParamValueCache:
+
+    def __init__(self, params: Iterable["zfit.Parameter"], size: int, dtype=tf.float64):
+        """Cache the scalar value of a function keyed on the values of `params`, usable inside a graph.
+
+        The keys and values are stored in (non-trainable) variables and the cache is therefore shared between
+        the eager execution and all graphs. If all `size` entries are filled, the oldest one is replaced.
+
+        Gradients are not cached: they are calculated by evaluating the function again, so that the cache
+        does not change any derivative (of any order).
+
+        Args:
+            params: Independent parameters the value depends on. Their values are the key of the cache.
+            size: Maximum number of cached values.
+            dtype: dtype of the values and the parameters.
+        """
+        self.params = list(params)
+        self.size = size
+        n_params = len(self.params)
+        # the variables are shared by all graphs and can be created while tracing any of them, which a `tf.Variable`
+        # inside a `tf.function` does not allow
+        with tf.init_scope():
+            self._keys = ResourceVariable(tf.zeros(shape=(size, n_params), dtype=dtype), trainable=False)
+            self._values = ResourceVariable(tf.zeros(shape=(size,), dtype=dtype), trainable=False)
+            self._filled = ResourceVariable(tf.zeros(shape=(size,), dtype=tf.bool), trainable=False)
+            self._position = ResourceVariable(0, trainable=False)
+
+    def __call__(self, func: Callable[[], tf.Tensor]) -> tf.Tensor:
+        """Return the cached value of `func()` for the current values of the parameters or evaluate and store it.
+
+        Args:
+            func: Function without arguments returning a scalar that depends on `params`.
+
+        Returns:
+            The (possibly cached) value of `func()`.
+        """
+        params = self.params
+        key = tf.stack([tf.convert_to_tensor(param) for param in params]) if params else tf.zeros((0,),
+                                                                                                   dtype=self._keys.dtype)
+
+        @tf.custom_gradient
+        def cached_value(key):
+            is_hit = tf.logical_and(self._filled, tf.reduce_all(tf.equal(self._keys, key[None, :]), axis=1))
+
+            def lookup():
+                return tf.gather(self._values, tf.argmax(tf.cast(is_hit, tf.int32)))
+
+            def evaluate_and_store():
+                value = tf.reshape(func(), ())
+                position = self._position.read_value()
+                index = [[position]]
+                assign_ops = [self._values.scatter_nd_update(index, value[None]),
+                              self._filled.scatter_nd_update(index, [True]),
+                              self._position.assign((position + 1) % self.size)]
+                if params:  # scattering into an empty tensor fails
+                    assign_ops.append(self._keys.scatter_nd_update(index, key[None, :]))
+                with tf.control_dependencies(assign_ops):
+                    return tf.identity(value)
+
+            value = tf.cond(tf.reduce_any(is_hit), lookup, evaluate_and_store)
+
+            def grad(dvalue, variables=None):
+                with tf.GradientTape(watch_accessed_variables=False) as tape:
+                    tape.watch(params)
+                    value = tf.reshape(func(), ())
+                gradients = tape.gradient(value, params, unconnected_gradients=tf.UnconnectedGradients.ZERO)
+                key_grad = dvalue * tf.stack(gradients) if params else tf.zeros_like(key)
+                if variables is None:
+                    return key_grad
+                # the dependency on the variables is already expressed by the gradient of the key
+                return key_grad, [tf.zeros_like(var) for var in variables]
+
+            return value, grad
+
+        return cached_value(key)
+
+    def __repr__(self) -> str:
+        return f"<ParamValueCache: size={self.size}, params={[param.name for param in self.params]}>"
+
+
 def clear_graph_cache():
     from zfit.z.zextension import FunctionWrapperRegistry
 
@@ -15,6 +15,22 @@ from .legacy import deprecated
 from .temporary import TemporarilySet
 
 
+class ChunkingOptions(DotDict):
+    """Options for chunking large calculations, e.g. `active` and `max_n_points`.
+
+    The options are read when a graph is built, changing them therefore clears the graph cache.
+    """
+
+    def __setitem__(self, key, value):
+        changed = key in self and self[key] != value
+        super().__setitem__(key, value)
+        if changed:
+            from .cache import clear_graph_cache
+            clear_graph_cache()
+
+    __setattr__ = __setitem__
+
+
 class RunManager:
     DEFAULT_MODE = {'graph': 'auto',
                     'autograd': True}
@@ -22,7 +38,7 @@ class RunManager:
     def __init__(self, n_cpu='auto'):
         """Handle the resources and runtime specific options. The `run` method is equivalent to `sess.run`"""
         self.MAX_CHUNK_SIZE = sys.maxsize
-        self.chunking = DotDict()
+        self.chunking = ChunkingOptions()
         self._cpu = []
         self._n_cpu = None
         self._inter_cpus = None
@@ -37,7 +53,7 @@ class RunManager:
         # HACK END
 
         # set default values
-        self.chunking.active = False  # not yet implemented the chunking...
+        self.chunking.active = False
         self.chunking.max_n_points = 1000000
 
     @property